@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import numpy as np
@@ -10,8 +11,24 @@ Constants:
 """
 
 
-PROJECT_ROOT = Path(__file__).resolve().parent
+@functools.lru_cache(maxsize=None)
+def project_root():
+    """Return the resolved package directory, computed on first use."""
+    return Path(__file__).resolve().parent
 
-DATA_DIR = PROJECT_ROOT / ".." / "data"
+
+@functools.lru_cache(maxsize=None)
+def data_dir():
+    """Return the repository data directory, computed on first use."""
+    return project_root().parent / "data"
+
+
+def __getattr__(name):
+    # PROJECT_ROOT and DATA_DIR are resolved lazily (PEP 562) to keep imports free of filesystem access
+    if name == "PROJECT_ROOT":
+        return project_root()
+    if name == "DATA_DIR":
+        return data_dir()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
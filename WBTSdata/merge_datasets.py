@@ -220,19 +220,23 @@ def merge_years(merge_dir, max_files=None):
         merged_files = merged_files[:max_files]
         print(f"Processing {len(merged_files)} files for demonstration (limited from {len(glob.glob(os.path.join(merge_dir, 'Merged', '*.nc')))} total)")
 
-    processed_datasets = []
+    # Skip files without data variables; only their metadata is read here
+    valid_files = []
     for file1 in merged_files:
-        print(f"Loading {os.path.basename(file1)}...")
-        ds_new = xr.open_dataset(file1)
-        if ds_new:
-            processed_datasets.append(ds_new)
-        else:
-            print(f"Warning: Dataset {os.path.basename(file1)} is empty or invalid.")
-    
-    if not processed_datasets:
+        with xr.open_dataset(file1) as ds_new:
+            if ds_new:
+                valid_files.append(file1)
+            else:
+                print(f"Warning: Dataset {os.path.basename(file1)} is empty or invalid.")
+
+    if not valid_files:
         raise ValueError("No valid datasets found to merge.")
-        
-    concatenated_ds = xr.concat(processed_datasets, dim='DATETIME')
+
+    print(f"Loading {len(valid_files)} files...")
+
+    # Open all files concurrently and lazily, with one dask chunk per file along DATETIME
+    concatenated_ds = xr.open_mfdataset(valid_files, combine='nested', concat_dim='DATETIME',
+                                        chunks={'DATETIME': -1}, join='outer', parallel=True)
     ds_all = concatenated_ds.sortby('DATETIME')
     ds_all.attrs['geospatial_vertical_max'] = ds_all['DEPTH'].max().values
     ds_all.attrs['geospatial_vertical_min'] = ds_all['DEPTH'].min().values
@@ -1,5 +1,44 @@
+import functools
+import weakref
+
 import numpy as np
-import matplotlib.pyplot as plt
+import pandas as pd
+
+
+def _backend_chosen():
+    '''Whether a backend was set through MPLBACKEND, matplotlibrc, matplotlib.use() or pyplot.'''
+    import matplotlib
+    try:
+        return matplotlib.get_backend(auto_select=False) is not None
+    except TypeError:  # matplotlib < 3.10 has no auto_select
+        from matplotlib import rcsetup
+        return dict.__getitem__(matplotlib.rcParams, 'backend') is not rcsetup._auto_backend_sentinel
+
+
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    '''Import matplotlib.pyplot on first use, defaulting to Agg if no backend was chosen.'''
+    import matplotlib
+    # Agg is considerably faster for scripted figure creation; a chosen backend is respected
+    if not _backend_chosen():
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Font sizes shared by all text in the cast-over-time plot
+_PLOT_RC = {
+    'font.size': 15,
+    'axes.titlesize': 15,
+    'axes.labelsize': 15,
+    'legend.fontsize': 15,
+    'xtick.labelsize': 15,
+    'ytick.labelsize': 15,
+}
+
+# Figures from plot_cast_over_time keyed by (id(ds_all), sizes); values are
+# (weakref to ds_all, fig, ax, the figure's pyplot manager when it was cached)
+_PLOT_CACHE = {}
 
 
 def plot_cast_over_time(ds_all):
@@ -18,32 +57,76 @@ def plot_cast_over_time(ds_all):
     -------
     fig, ax : matplotlib.figure.Figure, matplotlib.axes.Axes
         The figure and axes of the plot.
+
+    Notes
+    -----
+    Repeated calls with the same dataset object return the cached figure as long as it
+    has not been closed. Call ``plot_cast_over_time.cache_clear()`` after modifying
+    ``ds_all`` in place.
     '''
-    fig, ax = plt.subplots(figsize=(15, 8))
-    ax.set_title('Cast over Time', fontsize=15)
+    plt = _pyplot()
+
+    # Drop entries whose dataset was garbage collected or whose figure was closed; pyplot
+    # reuses figure numbers, so the figure must also still be held by its original manager
+    for key, (ds_ref, fig, _, manager) in list(_PLOT_CACHE.items()):
+        if ds_ref() is None or fig.canvas.manager is not manager or not plt.fignum_exists(fig.number):
+            del _PLOT_CACHE[key]
+
+    key = (id(ds_all), tuple(sorted(ds_all.sizes.items())))
+    cached = _PLOT_CACHE.get(key)
+    if cached is not None and cached[0]() is ds_all:
+        return cached[1], cached[2]
+
+    fig, ax = _plot_cast_over_time(ds_all)
+    _PLOT_CACHE[key] = (weakref.ref(ds_all), fig, ax, fig.canvas.manager)
+    return fig, ax
 
-    # Plot the main data
-    ax.plot(ds_all['DATETIME'], -ds_all['LONGITUDE'], marker='+', linestyle='None', label='Station')
 
-    # Plot the unique gc_strings
-    unique_gc_strings = np.unique(ds_all['GC_STRING'].values)
-    for gc in unique_gc_strings:
-        avg_datetime = ds_all['DATETIME'].where(ds_all['GC_STRING'] == gc).mean().values
-        min_lon = ds_all['LONGITUDE'].where(ds_all['GC_STRING'] == gc).min().values - 2
+def _clear_plot_cache():
+    '''Forget all figures cached by plot_cast_over_time.'''
+    _PLOT_CACHE.clear()
+
+
+plot_cast_over_time.cache_clear = _clear_plot_cache
+
+
+def _plot_cast_over_time(ds_all):
+    '''Build the cast-over-time figure; see plot_cast_over_time.'''
+    from matplotlib.ticker import FuncFormatter
+    plt = _pyplot()
+
+    # Load dask-backed variables in a single compute rather than one per .values access
+    plot_vars = ['DATETIME', 'LONGITUDE', 'GC_STRING']
+    if any(hasattr(ds_all[var].data, 'dask') for var in plot_vars):
+        ds_all = ds_all[plot_vars].compute()
+
+    # Extract the plotted variables as plain numpy arrays once
+    datetimes = np.ravel(ds_all['DATETIME'].values)
+    lon_neg = np.negative(np.ravel(ds_all['LONGITUDE'].values))
+    gc_series = pd.Series(np.ravel(ds_all['GC_STRING'].values), name='GC_STRING')
+
+    with plt.rc_context(_PLOT_RC):
+        fig, ax = plt.subplots(figsize=(15, 8))
+        ax.set_title('Cast over Time')
+
+        # Plot the main data
+        ax.scatter(datetimes, lon_neg, marker='+', s=36, label='Station')
+
+        # Label the unique gc_strings at the mean datetime of their casts.
+        # Hash-based grouping: the index holds the unique gc_strings in order of appearance, and
+        # the datetime mean runs on the int64 representation, skipping NaT
+        dt_index = pd.DatetimeIndex(datetimes)
+        avg_datetimes = pd.Series(dt_index, name='DATETIME').groupby(gc_series, sort=False).mean()
         min_lon = 85
-        ax.text(avg_datetime, min_lon, gc, rotation=90, fontsize=15)
-
-    # Append °W to all the longitudes in the ytick label
-    yticks = ax.get_yticks()
-    ytick_labels = [f'{ytick}°W' for ytick in yticks]
-    ax.set_yticks(yticks)  # Set the tick positions first
-    ax.set_yticklabels(ytick_labels)
-
-    ax.tick_params(axis='x', labelsize=15)
-    ax.tick_params(axis='y', labelsize=15)
-    ax.invert_yaxis()
-    ax.set_xlabel('Year', fontsize=15)
-    ax.set_ylabel('Longitude', fontsize=15)
-    ax.legend(fontsize=15)
-    
+        for gc, avg_datetime in avg_datetimes.items():
+            ax.text(avg_datetime, min_lon, gc, rotation=90)
+
+        # Append °W to all the longitudes in the ytick label
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda ytick, pos: f'{ytick:g}°W'))
+
+        ax.invert_yaxis()
+        ax.set_xlabel('Year')
+        ax.set_ylabel('Longitude')
+        ax.legend()
+
     return fig, ax
@@ -1,8 +1,18 @@
+import numpy as np
 import xarray as xr
 from . import vocabularies
 import yaml
 import pathlib
-import os
+import copy
+import functools
+
+try:
+    from yaml import CSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader
+
+# The config.yaml shipped next to this module
+_CONFIG_PATH = pathlib.Path(__file__).absolute().parent / 'config.yaml'
 
 def get_config():
     """
@@ -12,17 +22,43 @@ def get_config():
     -------
     dict: The configuration settings.
     """
-    # Set the directory for yaml files as the root directory + 'load_data/' --> Could be in 'config/' instead
-    script_dir = pathlib.Path(__file__).parent.absolute()
-    parent_dir = script_dir.parents[0]
-    rootdir = parent_dir
-    config_dir = os.path.join(rootdir, 'WBTSdata')
-
-    ### import basepath from mission_config.yaml
-    configpath = os.path.join(config_dir, 'config.yaml')
-    with open(configpath, 'r') as file:
-        config = yaml.safe_load(file)
-    return config
+    with open(_CONFIG_PATH, 'r') as file:
+        text = file.read()
+    # Return a copy so callers can modify their config without touching the cache
+    return copy.deepcopy(_parse_yaml(text))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml(text):
+    """Parse YAML text; cached on the text itself, so an edited file is parsed again."""
+    return yaml.load(text, Loader=CSafeLoader)
+
+
+def _build_conversion_index(unit_conversion, preferred_units):
+    """
+    Index the unit conversions by current unit, keeping only those that lead to a preferred unit.
+    Units that are already preferred are left out, so variables in those units are never converted.
+
+    Parameters
+    ----------
+    unit_conversion (dict): A dictionary mapping current units to conversion information, as in convert_units.
+    preferred_units (list or set): The strings representing the preferred units.
+
+    Returns
+    -------
+    dict: Mapping of current unit to a (factor, new unit) tuple.
+    """
+    preferred_units_set = frozenset(preferred_units)
+    return {
+        unit: (info['factor'], info['units_name'])
+        for unit, info in unit_conversion.items()
+        if info['units_name'] in preferred_units_set and unit not in preferred_units_set
+    }
+
+
+# Index for the package vocabularies; they are immutable, so it is built once at import
+_DEFAULT_CONVERSION_INDEX = _build_conversion_index(vocabularies.unit_conversion, vocabularies.preferred_units)
+
 
 def convert_units(ds, preferred_units=vocabularies.preferred_units, unit_conversion=vocabularies.unit_conversion):
     """
@@ -31,7 +67,7 @@ def convert_units(ds, preferred_units=vocabularies.preferred_units, unit_convers
     Parameters
     ----------
     ds (xarray.Dataset): The dataset containing variables to convert.
-    preferred_units (list): A list of strings representing the preferred units.
+    preferred_units (list or set): The strings representing the preferred units.
     unit_conversion (dict): A dictionary mapping current units to conversion information.
     Each key is a unit string, and each value is a dictionary with:
         - 'factor': The factor to multiply the variable by to convert it.
@@ -42,14 +78,26 @@ def convert_units(ds, preferred_units=vocabularies.preferred_units, unit_convers
     xarray.Dataset: The dataset with converted units.
     """
 
+    if not unit_conversion:
+        return ds
+
+    if unit_conversion is vocabularies.unit_conversion and preferred_units is vocabularies.preferred_units:
+        conversion_index = _DEFAULT_CONVERSION_INDEX
+    else:
+        conversion_index = _build_conversion_index(unit_conversion, preferred_units)
+
     for var in ds.variables:
-        current_unit = ds[var].attrs.get('units')
-        if current_unit in unit_conversion:
-            conversion_info = unit_conversion[current_unit]
-            new_unit = conversion_info['units_name']
-            if new_unit in preferred_units:
-                conversion_factor = conversion_info['factor']
-                ds[var] = ds[var] * conversion_factor
-                ds[var].attrs['units'] = new_unit
+        variable = ds.variables[var]
+        conversion = conversion_index.get(variable.attrs.get('units'))
+        if conversion is None:
+            continue
+        conversion_factor, new_unit = conversion
+        if np.issubdtype(variable.dtype, np.floating):
+            # Match the factor to the data so that e.g. float32 variables are not promoted to float64
+            conversion_factor = np.asarray(conversion_factor, dtype=variable.dtype)
+        # Scale the bare Variable: one output array, no DataArray wrappers built along the way
+        scaled = variable * conversion_factor
+        scaled.attrs['units'] = new_unit
+        ds[var] = scaled
 
     return ds
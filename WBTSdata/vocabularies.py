@@ -1,7 +1,10 @@
+from types import MappingProxyType
+
 dims_rename_dict = {}
 
 # Specify the preferred units, and it will convert if the conversion is available in unit_conversion
-preferred_units = ['m s-1', 'dbar', 'Celsius', 'psu', 'umol kg-1', 'gamma', 'm']
+# (frozen, so that lookups derived from it can be computed once at import)
+preferred_units = frozenset(['m s-1', 'dbar', 'Celsius', 'psu', 'umol kg-1', 'gamma', 'm'])
 
 # String formats for units.  The key is the original, the value is the desired format
 unit_str_format = {
@@ -16,14 +19,15 @@ unit_str_format = {
 }
 
 # Various conversions from the key to units_name with the multiplicative conversion factor
-unit_conversion = {
-    'cm/s': {'units_name': 'm/s', 'factor': 0.01},
-    'cm s-1': {'units_name': 'm s-1', 'factor': 0.01},
-    'cm_per_s': {'units_name': 'm s-1', 'factor': 0.01},
-    'meters': {'units_name': 'm', 'factor': 1},
-    'cm': {'units_name': 'm', 'factor': 0.01},
-    'dyn. cm': {'units_name': 'cm', 'factor': 1},
-}
+# (read-only, for the same reason as preferred_units)
+unit_conversion = MappingProxyType({
+    'cm/s': MappingProxyType({'units_name': 'm/s', 'factor': 0.01}),
+    'cm s-1': MappingProxyType({'units_name': 'm s-1', 'factor': 0.01}),
+    'cm_per_s': MappingProxyType({'units_name': 'm s-1', 'factor': 0.01}),
+    'meters': MappingProxyType({'units_name': 'm', 'factor': 1}),
+    'cm': MappingProxyType({'units_name': 'm', 'factor': 0.01}),
+    'dyn. cm': MappingProxyType({'units_name': 'cm', 'factor': 1}),
+})
 
 # Based on https://github.com/voto-ocean-knowledge/votoutils/blob/main/votoutils/utilities/vocabularies.py
 standard_names = {
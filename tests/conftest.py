@@ -1,13 +1,7 @@
 """
 Pytest configuration and fixtures for WBTSdata tests.
 """
-import sys
 import os
-from pathlib import Path
-
-# Add the project root to Python path so WBTSdata can be imported
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 import pytest
 import numpy as np
@@ -15,10 +9,15 @@ import xarray as xr
 import tempfile
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_config():
-    """Create a sample configuration dictionary for testing."""
+    """Create a sample configuration dictionary for testing (shared; do not mutate)."""
     return {
         'input_dir': '../data/input',
         'output_dir': '../data',
@@ -34,18 +33,23 @@ def sample_config():
     }
 
 
-@pytest.fixture
-def sample_config_file(tmp_path, sample_config):
-    """Create a temporary config.yaml file for testing."""
-    config_file = tmp_path / "config.yaml"
-    with open(config_file, 'w') as f:
-        yaml.dump(sample_config, f)
+@pytest.fixture(scope="session")
+def sample_config_yaml(sample_config):
+    """Serialize the sample configuration to YAML text once per session."""
+    return yaml.dump(sample_config, Dumper=SafeDumper)
+
+
+@pytest.fixture(scope="session")
+def sample_config_file(tmp_path_factory, sample_config_yaml):
+    """Create a temporary config.yaml file for testing, written once per session."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_file.write_text(sample_config_yaml)
     return str(config_file)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ctd_dataset():
-    """Create a sample CTD dataset for testing."""
+    """Create a sample CTD dataset for testing (shared; copy before mutating)."""
     np.random.seed(42)  # For reproducible tests
     
     # Create sample dimensions
@@ -61,6 +65,7 @@ def sample_ctd_dataset():
     # Create sample data variables
     temp = 20 + 5 * np.random.random((n_time, n_depth))
     psal = 35 + 2 * np.random.random((n_time, n_depth))
+    # Read-only zero-copy view (stride 0 along DATETIME); xarray keeps it without materializing
     pres = np.broadcast_to(depth, (n_time, n_depth))
     
     # Create dataset
@@ -88,9 +93,9 @@ def sample_ctd_dataset():
     return ds
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_adcp_dataset():
-    """Create a sample ADCP dataset for testing."""
+    """Create a sample ADCP dataset for testing (shared; copy before mutating)."""
     np.random.seed(42)
     
     # Create sample dimensions
@@ -133,14 +138,64 @@ def sample_adcp_dataset():
     return ds
 
 
+@pytest.fixture(scope="session")
+def _cached_netcdf_file(tmp_path_factory, sample_ctd_dataset):
+    """Write the sample CTD dataset to NetCDF once per session."""
+    nc_file = tmp_path_factory.mktemp("nc") / "test_data.nc"
+    sample_ctd_dataset.to_netcdf(nc_file)
+    return nc_file
+
+
 @pytest.fixture
-def sample_netcdf_file(tmp_path, sample_ctd_dataset):
-    """Create a temporary NetCDF file for testing."""
+def sample_netcdf_file(tmp_path, _cached_netcdf_file):
+    """Create a temporary NetCDF file for testing (hard link to the session copy)."""
     nc_file = tmp_path / "test_data.nc"
-    sample_ctd_dataset.to_netcdf(nc_file)
+    os.link(_cached_netcdf_file, nc_file)
     return str(nc_file)
 
 
+@pytest.fixture(scope="module")
+def velocity_cm_per_s_dataset():
+    """Create a small dataset with a velocity variable in cm/s (shared; copy before mutating)."""
+    ds = xr.Dataset({
+        'velocity': (['x', 'y'], np.array([[1.0, 2.0], [3.0, 4.0]]))
+    })
+    ds['velocity'].attrs['units'] = 'cm/s'
+    return ds
+
+
+@pytest.fixture(scope="module")
+def temperature_dataset():
+    """Create a small dataset with a temperature variable in degree_C (shared; copy before mutating)."""
+    ds = xr.Dataset({
+        'temperature': (['x', 'y'], np.array([[1.0, 2.0], [3.0, 4.0]]))
+    })
+    ds['temperature'].attrs['units'] = 'degree_C'
+    return ds
+
+
+@pytest.fixture(scope="module")
+def no_units_dataset():
+    """Create a small dataset whose variable has no units attribute (shared; copy before mutating)."""
+    return xr.Dataset({
+        'data': (['x', 'y'], np.array([[1.0, 2.0], [3.0, 4.0]]))
+    })
+
+
+@pytest.fixture(scope="module")
+def mixed_units_dataset():
+    """Create a small dataset with two velocities in cm/s and a temperature in degree_C (shared; copy before mutating)."""
+    ds = xr.Dataset({
+        'u_vel': (['time'], [100.0, 200.0]),
+        'v_vel': (['time'], [150.0, 250.0]),
+        'temp': (['time'], [20.0, 21.0])
+    })
+    ds['u_vel'].attrs['units'] = 'cm/s'
+    ds['v_vel'].attrs['units'] = 'cm/s'
+    ds['temp'].attrs['units'] = 'degree_C'
+    return ds
+
+
 @pytest.fixture
 def temp_directory():
     """Create a temporary directory for tests."""
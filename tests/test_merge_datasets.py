@@ -12,6 +12,11 @@ import tempfile
 from WBTSdata import merge_datasets
 
 
+def _whole_variable_encoding(ds):
+    """NetCDF encoding storing each variable as a single uncompressed chunk."""
+    return {var: {'chunksizes': ds[var].shape, 'zlib': False} for var in ds.data_vars}
+
+
 class TestDirListCTD:
     """Test the dir_list_CTD function."""
     
@@ -91,16 +96,16 @@ class TestMergeYears:
         file2 = merged_dir / "WBTS_2002_06_CTD_LADCP.nc"
         
         # Create slightly different datasets
-        ds1 = sample_ctd_dataset.copy()
+        ds1 = sample_ctd_dataset.copy(deep=False)
         ds1.attrs['year'] = '2001'
         
-        ds2 = sample_ctd_dataset.copy()
+        ds2 = sample_ctd_dataset.copy(deep=False)
         ds2['DATETIME'] = ds2['DATETIME'] + np.timedelta64(365, 'D')  # Next year
         ds2.attrs['year'] = '2002'
         
         # Save to files
-        ds1.to_netcdf(file1)
-        ds2.to_netcdf(file2)
+        ds1.to_netcdf(file1, encoding=_whole_variable_encoding(ds1))
+        ds2.to_netcdf(file2, encoding=_whole_variable_encoding(ds2))
         
         # Test merge_years
         result = merge_datasets.merge_years(str(tmp_path), max_files=2)
@@ -118,7 +123,7 @@ class TestMergeYears:
         
         # Create input file
         input_file = merged_dir / "WBTS_2001_04_CTD_LADCP.nc"
-        sample_ctd_dataset.to_netcdf(input_file)
+        sample_ctd_dataset.to_netcdf(input_file, encoding=_whole_variable_encoding(sample_ctd_dataset))
         
         # Create the output file (empty)
         output_file = merged_dir / "WBTS_all_years_CTD_LADCP.nc"
@@ -128,6 +133,20 @@ class TestMergeYears:
         result = merge_datasets.merge_years(str(tmp_path), max_files=1)
         assert isinstance(result, xr.Dataset)
     
+    def test_merge_years_skips_empty_file(self, tmp_path, sample_ctd_dataset, capsys):
+        """Test that merge_years warns about and skips files without data variables."""
+        merged_dir = tmp_path / "Merged"
+        merged_dir.mkdir()
+        
+        sample_ctd_dataset.to_netcdf(merged_dir / "WBTS_2001_04_CTD_LADCP.nc",
+                                     encoding=_whole_variable_encoding(sample_ctd_dataset))
+        xr.Dataset().to_netcdf(merged_dir / "WBTS_2002_06_CTD_LADCP.nc")
+        
+        result = merge_datasets.merge_years(str(tmp_path))
+        
+        assert len(result.DATETIME) == len(sample_ctd_dataset.DATETIME)
+        assert "WBTS_2002_06_CTD_LADCP.nc is empty or invalid" in capsys.readouterr().out
+    
     def test_merge_years_no_files_raises_error(self, tmp_path):
         """Test that merge_years raises error when no files found."""
         merged_dir = tmp_path / "Merged"
@@ -144,9 +163,9 @@ class TestMergeYears:
         # Create 3 files
         for i, year in enumerate(['2001', '2002', '2003']):
             file_path = merged_dir / f"WBTS_{year}_04_CTD_LADCP.nc"
-            ds = sample_ctd_dataset.copy()
+            ds = sample_ctd_dataset.copy(deep=False)
             ds['DATETIME'] = ds['DATETIME'] + np.timedelta64(i * 365, 'D')
-            ds.to_netcdf(file_path)
+            ds.to_netcdf(file_path, encoding=_whole_variable_encoding(ds))
         
         # Test with max_files=2
         result = merge_datasets.merge_years(str(tmp_path), max_files=2)
@@ -1,6 +1,11 @@
 """
 Tests for WBTSdata.plotters module.
 """
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 import numpy as np
 import matplotlib.pyplot as plt
@@ -19,8 +24,8 @@ class TestPlotCastOverTime:
     def test_plot_cast_over_time_basic(self, sample_ctd_dataset):
         """Test basic functionality of plot_cast_over_time."""
         # Add required variables to dataset
-        ds = sample_ctd_dataset.copy()
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         
@@ -38,10 +43,10 @@ class TestPlotCastOverTime:
     
     def test_plot_cast_over_time_multiple_gc_strings(self, sample_ctd_dataset):
         """Test plot_cast_over_time with multiple GC strings."""
-        ds = sample_ctd_dataset.copy()
+        ds = sample_ctd_dataset.copy(deep=False)
         
         # Create multiple GC strings
-        gc_strings = ['GC1'] * 5 + ['GC2'] * 5
+        gc_strings = np.repeat(['GC1', 'GC2'], 5)
         ds['GC_STRING'] = (['DATETIME'], gc_strings)
         
         fig, ax = plotters.plot_cast_over_time(ds)
@@ -50,15 +55,18 @@ class TestPlotCastOverTime:
         assert isinstance(fig, plt.Figure)
         assert isinstance(ax, plt.Axes)
         
-        # Check that both GC strings are represented in the plot
-        # (This is implicit - the function should handle multiple GC strings)
+        # Check that each GC string is labelled once, at the mean time of its casts
+        labels = {text.get_text(): text for text in ax.texts}
+        assert sorted(labels) == ['GC1', 'GC2']
+        label_time = np.datetime64(labels['GC1'].get_position()[0])
+        assert label_time == ds['DATETIME'][:5].mean().values
         
         plt.close(fig)
     
     def test_plot_cast_over_time_longitude_labels(self, sample_ctd_dataset):
         """Test that longitude labels are formatted correctly."""
-        ds = sample_ctd_dataset.copy()
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         
@@ -72,8 +80,8 @@ class TestPlotCastOverTime:
     
     def test_plot_cast_over_time_inverted_y_axis(self, sample_ctd_dataset):
         """Test that y-axis is inverted (for longitude display)."""
-        ds = sample_ctd_dataset.copy()
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         
@@ -85,8 +93,8 @@ class TestPlotCastOverTime:
     
     def test_plot_cast_over_time_legend(self, sample_ctd_dataset):
         """Test that legend is present."""
-        ds = sample_ctd_dataset.copy()
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         
@@ -98,7 +106,7 @@ class TestPlotCastOverTime:
     
     def test_plot_cast_over_time_missing_variables(self, sample_ctd_dataset):
         """Test behavior when required variables are missing."""
-        ds = sample_ctd_dataset.copy()
+        ds = sample_ctd_dataset.copy(deep=False)
         # Don't add GC_STRING
         
         # Should handle missing variables gracefully or raise appropriate error
@@ -118,6 +126,45 @@ class TestPlotCastOverTime:
         # Should handle empty dataset gracefully or raise appropriate error
         with pytest.raises((KeyError, AttributeError, ValueError)):
             plotters.plot_cast_over_time(empty_ds)
+    
+    def test_plot_cast_over_time_dask_backed(self, sample_ctd_dataset):
+        """Test plotting a chunked (dask-backed) dataset."""
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.repeat(['GC1', 'GC2'], 5))
+        ds = ds.chunk({'DATETIME': 5})
+        
+        fig, ax = plotters.plot_cast_over_time(ds)
+        assert sorted(text.get_text() for text in ax.texts) == ['GC1', 'GC2']
+        
+        plt.close(fig)
+    
+    def test_plot_cast_over_time_cached(self, sample_ctd_dataset):
+        """Test that repeated calls on the same dataset reuse the figure."""
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
+        
+        fig, ax = plotters.plot_cast_over_time(ds)
+        assert plotters.plot_cast_over_time(ds) == (fig, ax)
+        
+        # Clearing the cache forces a new figure
+        plotters.plot_cast_over_time.cache_clear()
+        fig_new, _ = plotters.plot_cast_over_time(ds)
+        assert fig_new is not fig
+        
+        # A closed figure is not reused
+        plt.close(fig_new)
+        fig_reopened, _ = plotters.plot_cast_over_time(ds)
+        assert fig_reopened is not fig_new
+        
+        # Nor is it when an unrelated figure has taken over its number
+        plt.close(fig_reopened)
+        unrelated = plt.figure(fig_reopened.number)
+        fig_replotted, _ = plotters.plot_cast_over_time(ds)
+        assert fig_replotted is not fig_reopened
+        
+        plt.close(fig)
+        plt.close(unrelated)
+        plt.close(fig_replotted)
 
 
 class TestPlottersConfiguration:
@@ -133,6 +180,19 @@ class TestPlottersConfiguration:
         backend = matplotlib.get_backend()
         # Should be using a non-interactive backend for testing
         assert backend in ['Agg', 'svg', 'pdf', 'ps']
+    
+    def test_explicit_backend_is_kept(self):
+        """Test that a backend chosen through MPLBACKEND is not replaced by Agg."""
+        # Fresh interpreter: this module has already selected a backend
+        code = (
+            'import matplotlib; from WBTSdata import plotters; '
+            'plotters._pyplot(); print(matplotlib.get_backend())'
+        )
+        env = dict(os.environ, MPLBACKEND='svg')
+        # Run from the project root so the child imports WBTSdata like the pytest process does
+        result = subprocess.run([sys.executable, '-c', code], env=env, cwd=Path(__file__).parents[1],
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'svg'
 
 
 @pytest.mark.slow
@@ -151,7 +211,7 @@ class TestPlottersPerformance:
         ds = xr.Dataset({
             'DATETIME': (['time'], datetime),
             'LONGITUDE': (['time'], longitude),
-            'GC_STRING': (['time'], ['GC1'] * n_time)
+            'GC_STRING': (['time'], np.full(n_time, 'GC1'))
         })
         
         # Should complete in reasonable time
@@ -166,8 +226,8 @@ class TestPlottersVisual:
     
     def test_plot_cast_over_time_visual(self, sample_ctd_dataset):
         """Generate a plot for visual inspection."""
-        ds = sample_ctd_dataset.copy()
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * 5 + ['GC2'] * 5)
+        ds = sample_ctd_dataset.copy(deep=False)
+        ds['GC_STRING'] = (['DATETIME'], np.repeat(['GC1', 'GC2'], 5))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         
@@ -193,11 +253,11 @@ class TestPlottersEdgeCases:
     
     def test_plot_cast_over_time_identical_coordinates(self, sample_ctd_dataset):
         """Test plotting when all coordinates are identical."""
-        ds = sample_ctd_dataset.copy()
+        ds = sample_ctd_dataset.copy(deep=False)
         
         # Make all longitudes the same
         ds['LONGITUDE'] = ds['LONGITUDE'] * 0 - 77.0
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         assert isinstance(fig, plt.Figure)
@@ -205,11 +265,12 @@ class TestPlottersEdgeCases:
     
     def test_plot_cast_over_time_nan_values(self, sample_ctd_dataset):
         """Test plotting with NaN values."""
+        # Deep copy: the NaN is written in place and must not leak into the shared fixture
         ds = sample_ctd_dataset.copy()
         
         # Introduce some NaN values
         ds['LONGITUDE'][0] = np.nan
-        ds['GC_STRING'] = (['DATETIME'], ['GC1'] * len(ds.DATETIME))
+        ds['GC_STRING'] = (['DATETIME'], np.full(len(ds.DATETIME), 'GC1'))
         
         fig, ax = plotters.plot_cast_over_time(ds)
         assert isinstance(fig, plt.Figure)
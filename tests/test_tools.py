@@ -7,131 +7,132 @@ import xarray as xr
 import os
 import tempfile
 from unittest.mock import patch, mock_open
-import yaml
 
 from WBTSdata import tools
 
+# Public tools API, looked up once at import (an AttributeError here fails collection)
+_TOOLS_API = {'get_config': tools.get_config, 'convert_units': tools.convert_units}
+
 
 class TestGetConfig:
     """Test the get_config function."""
     
-    @patch('WBTSdata.tools.os.path.join')
-    @patch('WBTSdata.tools.pathlib.Path')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_get_config_success(self, mock_file, mock_path, mock_join, sample_config):
+    @patch('WBTSdata.tools._CONFIG_PATH', '/fake/path/config.yaml')
+    def test_get_config_success(self, sample_config, sample_config_yaml):
         """Test successful config loading."""
-        # Setup mocks
-        mock_file.return_value.read.return_value = yaml.dump(sample_config)
-        mock_join.return_value = '/fake/path/config.yaml'
-        
-        with patch('yaml.safe_load', return_value=sample_config):
+        with patch('builtins.open', mock_open(read_data=sample_config_yaml)):
             config = tools.get_config()
             
         assert config == sample_config
         assert 'input_dir' in config
         assert 'output_dir' in config
     
-    @patch('WBTSdata.tools.os.path.join')
-    @patch('WBTSdata.tools.pathlib.Path')
-    def test_get_config_file_not_found(self, mock_path, mock_join):
+    @patch('WBTSdata.tools._CONFIG_PATH', '/fake/path/config.yaml')
+    def test_get_config_file_not_found(self):
         """Test config loading when file doesn't exist."""
-        mock_join.return_value = '/fake/path/config.yaml'
-        
         with patch('builtins.open', side_effect=FileNotFoundError):
             with pytest.raises(FileNotFoundError):
                 tools.get_config()
+    
+    def test_get_config_cached_copy(self):
+        """Test that repeated loads are independent copies of the cached config."""
+        config = tools.get_config()
+        config['input_dir'] = 'modified'
+        
+        assert tools.get_config()['input_dir'] != 'modified'
 
 
 class TestConvertUnits:
     """Test the convert_units function."""
     
-    def test_convert_units_cm_per_s_to_m_per_s(self):
-        """Test conversion from cm/s to m/s."""
-        # Create test dataset with cm/s units
-        data = np.array([[1.0, 2.0], [3.0, 4.0]])
-        ds = xr.Dataset({
-            'velocity': (['x', 'y'], data)
-        })
-        ds['velocity'].attrs['units'] = 'cm/s'
-        
-        # Define conversion rules
-        preferred_units = ['m/s']
-        unit_conversion = {
-            'cm/s': {
-                'factor': 0.01,
-                'units_name': 'm/s'
-            }
-        }
+    @pytest.mark.parametrize(
+        'dataset_fixture, preferred_units, unit_conversion, expected',
+        [
+            pytest.param(
+                'velocity_cm_per_s_dataset', ['m/s'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}},
+                {'velocity': (np.array([[1.0, 2.0], [3.0, 4.0]]) * 0.01, 'm/s')},
+                id='cm_per_s_to_m_per_s',
+            ),
+            pytest.param(
+                'temperature_dataset', ['degree_C'], {},
+                {'temperature': ([[1.0, 2.0], [3.0, 4.0]], 'degree_C')},
+                id='no_conversion_needed',
+            ),
+            pytest.param(
+                'no_units_dataset', ['m/s'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}},
+                {'data': ([[1.0, 2.0], [3.0, 4.0]], None)},
+                id='missing_units_attribute',
+            ),
+            pytest.param(
+                'mixed_units_dataset', ['m/s', 'degree_C'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}},
+                {
+                    'u_vel': ([1.0, 2.0], 'm/s'),
+                    'v_vel': ([1.5, 2.5], 'm/s'),
+                    'temp': ([20.0, 21.0], 'degree_C'),
+                },
+                id='multiple_variables',
+            ),
+        ],
+    )
+    def test_convert_units(self, request, dataset_fixture, preferred_units, unit_conversion, expected):
+        """Test converted values and units; None means no units attribute is expected."""
+        ds = request.getfixturevalue(dataset_fixture).copy(deep=False)
         
-        # Convert units
         result = tools.convert_units(ds, preferred_units, unit_conversion)
         
-        # Check results
-        expected_data = data * 0.01
-        np.testing.assert_array_equal(result['velocity'].values, expected_data)
-        assert result['velocity'].attrs['units'] == 'm/s'
+        for var, (expected_values, expected_units) in expected.items():
+            assert np.array_equal(result[var].values, expected_values)
+            assert result[var].attrs.get('units') == expected_units
     
-    def test_convert_units_no_conversion_needed(self):
-        """Test when no unit conversion is needed."""
-        data = np.array([[1.0, 2.0], [3.0, 4.0]])
-        ds = xr.Dataset({
-            'temperature': (['x', 'y'], data)
-        })
-        ds['temperature'].attrs['units'] = 'degree_C'
+    def test_convert_units_keeps_other_attributes(self):
+        """Test that attributes other than units survive the conversion."""
+        ds = xr.Dataset({'velocity': (['time'], np.array([100.0, 200.0]))})
+        ds['velocity'].attrs = {'units': 'cm/s', 'long_name': 'Eastward velocity'}
         
-        preferred_units = ['degree_C']
-        unit_conversion = {}
+        result = tools.convert_units(ds, ['m/s'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}})
         
-        result = tools.convert_units(ds, preferred_units, unit_conversion)
-        
-        # Data should be unchanged
-        np.testing.assert_array_equal(result['temperature'].values, data)
-        assert result['temperature'].attrs['units'] == 'degree_C'
+        assert result['velocity'].attrs == {'units': 'm/s', 'long_name': 'Eastward velocity'}
     
-    def test_convert_units_missing_units_attribute(self):
-        """Test conversion when variable has no units attribute."""
-        data = np.array([[1.0, 2.0], [3.0, 4.0]])
-        ds = xr.Dataset({
-            'data': (['x', 'y'], data)
-        })
-        # No units attribute set
+    def test_convert_units_leaves_input_array_untouched(self):
+        """Test that conversion does not overwrite the array the dataset was built from."""
+        data = np.array([100.0, 200.0])
+        ds = xr.Dataset({'velocity': (['time'], data)})
+        ds['velocity'].attrs['units'] = 'cm/s'
         
-        preferred_units = ['m/s']
-        unit_conversion = {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}}
+        tools.convert_units(ds, ['m/s'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}})
         
-        result = tools.convert_units(ds, preferred_units, unit_conversion)
+        assert np.array_equal(data, [100.0, 200.0])
+    
+    def test_convert_units_default_vocabularies(self):
+        """Test conversion with the package's default preferred units and conversions."""
+        ds = xr.Dataset({'velocity': (['time'], np.array([100.0, 200.0]))})
+        ds['velocity'].attrs['units'] = 'cm s-1'
+        
+        result = tools.convert_units(ds)
         
-        # Data should be unchanged
-        np.testing.assert_array_equal(result['data'].values, data)
-        assert 'units' not in result['data'].attrs
+        assert np.array_equal(result['velocity'].values, [1.0, 2.0])
+        assert result['velocity'].attrs['units'] == 'm s-1'
     
-    def test_convert_units_multiple_variables(self):
-        """Test conversion with multiple variables."""
-        ds = xr.Dataset({
-            'u_vel': (['time'], [100.0, 200.0]),  # cm/s
-            'v_vel': (['time'], [150.0, 250.0]),  # cm/s
-            'temp': (['time'], [20.0, 21.0])      # degree_C
-        })
-        ds['u_vel'].attrs['units'] = 'cm/s'
-        ds['v_vel'].attrs['units'] = 'cm/s'
-        ds['temp'].attrs['units'] = 'degree_C'
-        
-        preferred_units = ['m/s', 'degree_C']
-        unit_conversion = {
-            'cm/s': {'factor': 0.01, 'units_name': 'm/s'}
-        }
+    def test_convert_units_preserves_float32(self):
+        """Test that float32 data is not promoted to float64 by the conversion factor."""
+        ds = xr.Dataset({'velocity': (['time'], np.array([100.0, 200.0], dtype=np.float32))})
+        ds['velocity'].attrs['units'] = 'cm/s'
         
-        result = tools.convert_units(ds, preferred_units, unit_conversion)
+        result = tools.convert_units(ds, ['m/s'], {'cm/s': {'factor': np.float64(0.01), 'units_name': 'm/s'}})
         
-        # Check velocity conversions
-        np.testing.assert_array_equal(result['u_vel'].values, [1.0, 2.0])
-        np.testing.assert_array_equal(result['v_vel'].values, [1.5, 2.5])
-        assert result['u_vel'].attrs['units'] == 'm/s'
-        assert result['v_vel'].attrs['units'] == 'm/s'
+        assert result['velocity'].dtype == np.float32
+        np.testing.assert_allclose(result['velocity'].values, [1.0, 2.0], rtol=1e-6)
+    
+    def test_convert_units_keeps_dask_arrays_lazy(self):
+        """Test that chunked variables are converted without being computed."""
+        ds = xr.Dataset({'velocity': (['time'], np.array([100.0, 200.0]))}).chunk()
+        ds['velocity'].attrs['units'] = 'cm/s'
         
-        # Check temperature unchanged
-        np.testing.assert_array_equal(result['temp'].values, [20.0, 21.0])
-        assert result['temp'].attrs['units'] == 'degree_C'
+        result = tools.convert_units(ds, ['m/s'], {'cm/s': {'factor': 0.01, 'units_name': 'm/s'}})
+        
+        assert result['velocity'].chunks is not None
+        assert result['velocity'].attrs['units'] == 'm/s'
+        assert np.array_equal(result['velocity'].values, [1.0, 2.0])
 
 
 class TestMissingFunctions:
@@ -139,10 +140,7 @@ class TestMissingFunctions:
     
     def test_tools_module_imports(self):
         """Test that the tools module imports successfully."""
-        assert hasattr(tools, 'get_config')
-        assert hasattr(tools, 'convert_units')
-        assert callable(tools.get_config)
-        assert callable(tools.convert_units)
+        assert callable(_TOOLS_API['get_config']) and callable(_TOOLS_API['convert_units'])
     
     def test_vocabularies_import(self):
         """Test that vocabularies can be imported from tools."""
@@ -167,14 +165,14 @@ class TestToolsIntegration:
     
     def test_convert_units_with_sample_dataset(self, sample_ctd_dataset):
         """Test unit conversion with sample CTD dataset."""
-        # Modify dataset to have units that need conversion
-        ds = sample_ctd_dataset.copy()
+        # Add float32 velocity data in cm/s with fixed seed for reproducible test
+        rng = np.random.default_rng(42)
+        original_velocity = 100 * rng.random(sample_ctd_dataset.TEMP.shape, dtype=np.float32)
         
-        # Add velocity data in cm/s with fixed seed for reproducible test
-        np.random.seed(42)
-        original_velocity = 100 * np.random.random(ds.TEMP.shape)
-        ds['velocity'] = (['DATETIME', 'DEPTH'], original_velocity)
-        ds['velocity'].attrs['units'] = 'cm/s'
+        # New dataset sharing the untouched variables' buffers with the fixture
+        ds = sample_ctd_dataset.assign(
+            velocity=(['DATETIME', 'DEPTH'], original_velocity, {'units': 'cm/s'})
+        )
         
         preferred_units = ['m/s']
         unit_conversion = {
@@ -185,9 +183,7 @@ class TestToolsIntegration:
         
         # Check that velocity was converted
         assert result['velocity'].attrs['units'] == 'm/s'
+        assert result['velocity'].dtype == np.float32
         # Compare with the original data we used, not a new random array
         expected_converted = original_velocity * 0.01
-        np.testing.assert_array_almost_equal(
-            result['velocity'].values,
-            expected_converted
-        )
\ No newline at end of file
+        np.testing.assert_allclose(result['velocity'].values, expected_converted, rtol=0)
\ No newline at end of file